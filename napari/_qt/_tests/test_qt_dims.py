@@ -170,6 +170,26 @@ def test_slider_range(qtbot):
     assert first_slider.singleStep() == view.dims.range[0][2]
 
 
+def test_slice_label_width(qtbot):
+    """
+    Tests slice labels are resized when the number of digits changes
+    """
+    ndim = 4
+    view = QtDims(Dims(ndim))
+    qtbot.addWidget(view)
+
+    label = view.slider_widgets[0].curslice_label
+    width = label.width()
+
+    view.dims.set_range(0, (0, 1000, 1))
+    assert label.width() > width
+
+    # new sliders get the current width as well
+    view.dims.ndim = 5
+    new_label = view.slider_widgets[0].curslice_label
+    assert new_label.width() == label.width()
+
+
 def test_singleton_dims(qtbot):
     """
     Test singleton dims causes no slider.
@@ -210,6 +210,94 @@ def test_reordering_layers(qtbot):
     assert check_layout_dividers(view.vbox_layout, len(layers))
 
 
+def test_thumbnail_pixmap_reused(qtbot):
+    """
+    Test the thumbnail pixmap is only rebuilt when the thumbnail changes.
+    """
+    layers = LayerList()
+    view = QtLayerList(layers)
+
+    qtbot.addWidget(view)
+
+    layer = Image(np.random.random((10, 10)))
+    layers.append(layer)
+    widget = view.vbox_layout.itemAt(1).widget()
+    pixmap_key = widget.thumbnailLabel.pixmap().cacheKey()
+
+    # Identical thumbnail content does not rebuild the pixmap
+    layer._update_thumbnail()
+    qtbot.waitUntil(lambda: not widget._thumbnail_timer.isActive())
+    assert widget.thumbnailLabel.pixmap().cacheKey() == pixmap_key
+
+    # New thumbnail content does
+    layer.data = np.random.random((10, 10))
+    qtbot.waitUntil(
+        lambda: widget.thumbnailLabel.pixmap().cacheKey() != pixmap_key
+    )
+
+
+def test_thumbnail_events_coalesced(qtbot):
+    """
+    Test a burst of thumbnail events results in a single refresh.
+    """
+    layers = LayerList()
+    view = QtLayerList(layers)
+
+    qtbot.addWidget(view)
+
+    layer = Image(np.random.random((10, 10)))
+    layers.append(layer)
+    widget = view.vbox_layout.itemAt(1).widget()
+
+    for _ in range(5):
+        layer.data = np.random.random((10, 10))
+    assert widget._thumbnail_timer.isActive()
+
+    qtbot.waitUntil(lambda: not widget._thumbnail_timer.isActive())
+    np.testing.assert_array_equal(widget._thumbnail, layer.thumbnail)
+
+
+def test_visibility_checkbox_synced(qtbot):
+    """
+    Test the visibility checkbox follows the layer visibility.
+    """
+    layers = LayerList()
+    view = QtLayerList(layers)
+
+    qtbot.addWidget(view)
+
+    layer = Image(np.random.random((10, 10)))
+    layers.append(layer)
+    widget = view.vbox_layout.itemAt(1).widget()
+    assert widget.visibleCheckBox.isChecked()
+
+    layer.visible = False
+    assert not widget.visibleCheckBox.isChecked()
+
+    # Setting the same value again leaves the checkbox untouched
+    layer.visible = False
+    assert not widget.visibleCheckBox.isChecked()
+
+    widget.visibleCheckBox.setChecked(True)
+    assert layer.visible
+
+
+def test_divider_index(qtbot):
+    """
+    Test finding the divider closest to a drag position.
+    """
+    layers = LayerList()
+    view = QtLayerList(layers)
+
+    qtbot.addWidget(view)
+
+    view.centers = [10, 30, 50]
+    assert view._divider_index(0) == 0
+    assert view._divider_index(10) == 1
+    assert view._divider_index(40) == 2
+    assert view._divider_index(60) == 3
+
+
 def test_hex_to_name_is_updated():
     fail_msg = (
         "If this test fails then vispy have probably updated their color dictionary, located "
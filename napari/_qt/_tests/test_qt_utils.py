@@ -1,6 +1,19 @@
+import numpy as np
+import pytest
 from qtpy.QtCore import QObject, Signal
+from qtpy.QtGui import QColor, QImage
+from qtpy.QtWidgets import QAbstractItemView, QListWidget
 
-from ..utils import qt_signals_blocked
+from napari.layers import Labels
+
+from ..layers.qt_labels_layer import QtLabelsControls
+from ..utils import (
+    QImg2array,
+    checkerboard_pixmap,
+    drag_with_pixmap,
+    qt_signals_blocked,
+    rgba_array_to_pixmap,
+)
 
 
 class Emitter(QObject):
@@ -27,3 +40,91 @@ def test_signal_blocker(qtbot):
     with qt_signals_blocked(obj):
         obj.go()
         qtbot.wait(750)
+
+
+def test_checkerboard_pixmap(qtbot):
+    """make sure the checkerboard alternates light and dark tiles"""
+    pixmap = checkerboard_pixmap(24)
+    assert checkerboard_pixmap(24) is pixmap
+
+    arr = QImg2array(pixmap.toImage())
+    assert arr.shape == (24, 24, 4)
+    light, dark = [230, 230, 230, 255], [25, 25, 25, 255]
+    assert arr[0, 0].tolist() == light
+    assert arr[0, 4].tolist() == dark
+    assert arr[4, 0].tolist() == dark
+    assert arr[4, 4].tolist() == light
+    assert arr[23, 23].tolist() == light
+
+
+@pytest.mark.parametrize(
+    'fmt',
+    [
+        QImage.Format_ARGB32,
+        QImage.Format_ARGB32_Premultiplied,
+        QImage.Format_RGB32,
+        QImage.Format_RGBA8888,
+    ],
+)
+def test_qimg2array_channel_order(fmt):
+    """make sure QImg2array returns RGBA channels whatever the image format"""
+    img = QImage(3, 2, fmt)
+    img.fill(QColor(10, 20, 30))
+    img.setPixelColor(2, 1, QColor(200, 100, 50))
+    arr = QImg2array(img)
+    assert arr.shape == (2, 3, 4)
+    assert arr[0, 0].tolist() == [10, 20, 30, 255]
+    assert arr[1, 2].tolist() == [200, 100, 50, 255]
+
+
+def test_rgba_array_to_pixmap():
+    """make sure non-contiguous arrays round trip through a pixmap"""
+    arr = np.zeros((6, 4, 4), dtype=np.uint8)
+    arr[..., 0] = np.arange(4) * 50
+    arr[..., 3] = 255
+    view = arr[::2]
+    pixmap = rgba_array_to_pixmap(view)
+    assert (pixmap.width(), pixmap.height()) == (4, 3)
+    np.testing.assert_array_equal(QImg2array(pixmap.toImage()), view)
+
+
+def test_disable_with_opacity(qtbot):
+    """make sure the opacity effect is created once and then toggled"""
+    layer = Labels(np.zeros((5, 5), dtype=int))
+    qtctrl = QtLabelsControls(layer)
+    qtbot.addWidget(qtctrl)
+    assert qtctrl.paint_button.graphicsEffect() is None
+
+    layer.editable = False
+    assert not qtctrl.paint_button.isEnabled()
+    effect = qtctrl.paint_button.graphicsEffect()
+    assert effect.isEnabled()
+    assert effect.opacity() == 0.5
+
+    layer.editable = True
+    assert qtctrl.paint_button.isEnabled()
+    assert qtctrl.paint_button.graphicsEffect() is effect
+    assert not effect.isEnabled()
+
+    layer.editable = False
+    assert qtctrl.paint_button.graphicsEffect() is effect
+    assert effect.isEnabled()
+
+
+def test_drag_with_pixmap(qtbot):
+    """make sure the drag pixmap only covers the selected items"""
+    widget = QListWidget()
+    qtbot.addWidget(widget)
+    widget.setSelectionMode(QAbstractItemView.ExtendedSelection)
+    widget.addItems(['a', 'b', 'c', 'd'])
+    widget.show()
+
+    widget.item(1).setSelected(True)
+    drag = drag_with_pixmap(widget)
+    rect = widget.visualItemRect(widget.item(1))
+    assert drag.pixmap().size() == rect.size()
+
+    widget.item(3).setSelected(True)
+    drag = drag_with_pixmap(widget)
+    bounds = rect.united(widget.visualItemRect(widget.item(3)))
+    assert drag.pixmap().size() == bounds.size()
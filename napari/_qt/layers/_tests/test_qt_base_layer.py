@@ -0,0 +1,57 @@
+import numpy as np
+
+from napari._qt.layers.qt_base_layer import QtLayerControls
+from napari.layers import Image
+
+
+def test_blending_combobox_synced(qtbot):
+    """The blending combobox should follow the layer blending mode."""
+    layer = Image(np.random.random((10, 10)), blending='additive')
+    qtctrl = QtLayerControls(layer)
+    qtbot.addWidget(qtctrl)
+    assert qtctrl.blendComboBox.currentText() == 'additive'
+
+    layer.blending = 'opaque'
+    assert qtctrl.blendComboBox.currentText() == 'opaque'
+
+    qtctrl.changeBlending('translucent')
+    assert layer.blending == 'translucent'
+
+
+def test_opacity_slider_synced(qtbot):
+    """The opacity slider should follow the layer opacity."""
+    layer = Image(np.random.random((10, 10)), opacity=0.29)
+    qtctrl = QtLayerControls(layer)
+    qtbot.addWidget(qtctrl)
+    assert qtctrl.opacitySlider.value() == 29
+
+    layer.opacity = 0.5
+    assert qtctrl.opacitySlider.value() == 50
+
+    qtctrl.opacitySlider.setValue(80)
+    assert layer.opacity == 0.8
+
+
+def test_reselecting_blending_does_not_emit(qtbot):
+    """Picking the current blending mode again should not emit an event."""
+    layer = Image(np.random.random((10, 10)), blending='additive')
+    qtctrl = QtLayerControls(layer)
+    qtbot.addWidget(qtctrl)
+
+    emitted = []
+    layer.events.blending.connect(emitted.append)
+    qtctrl.changeBlending('additive')
+    assert emitted == []
+    qtctrl.changeBlending('opaque')
+    assert len(emitted) == 1
+
+
+def test_opacity_sync_does_not_emit(qtbot):
+    """Syncing the slider from the layer should not emit valueChanged."""
+    layer = Image(np.random.random((10, 10)))
+    qtctrl = QtLayerControls(layer)
+    qtbot.addWidget(qtctrl)
+
+    with qtbot.assertNotEmitted(qtctrl.opacitySlider.valueChanged):
+        layer.opacity = 0.3
+    assert qtctrl.opacitySlider.value() == 30
@@ -101,3 +101,55 @@ def test_clim_slider_step_size_and_precision(qtbot, mag):
     # the slider step size should also be inversely proportional to the data
     # range, with 1000 steps across the data range
     assert np.ceil(popup.slider._step * 10 ** (mag + 4)) == 10
+
+
+@pytest.mark.parametrize('layer', [Image(_IMAGE), Surface(_SURF)])
+def test_gamma_slider_throttled(qtbot, layer):
+    """Dragging the gamma slider should only apply the latest value"""
+    qtctrl = QtBaseImageControls(layer)
+    qtbot.addWidget(qtctrl)
+    layer.gamma = 1
+    qtctrl.gammaSlider.setSliderDown(True)
+    for value in (20, 50, 150):
+        qtctrl.gammaSlider.setValue(value)
+    assert qtctrl._gamma_timer.isActive()
+    assert layer.gamma == 1
+    qtbot.waitUntil(lambda: layer.gamma == 1.5)
+
+    # releasing the slider flushes the pending value straight away
+    qtctrl.gammaSlider.setValue(120)
+    qtctrl.gammaSlider.setSliderDown(False)
+    assert layer.gamma == 1.2
+    assert not qtctrl._gamma_timer.isActive()
+
+
+def test_gamma_slider_changed_sync(qtbot):
+    """Changes outside of a drag should apply immediately"""
+    layer = Image(_IMAGE)
+    qtctrl = QtBaseImageControls(layer)
+    qtbot.addWidget(qtctrl)
+    qtctrl.gamma_slider_changed(120)
+    assert layer.gamma == 1.2
+    qtctrl.gammaSlider.setValue(80)
+    assert layer.gamma == 0.8
+    assert not qtctrl._gamma_timer.isActive()
+
+
+@patch.object(QRangeSliderPopup, 'show')
+def test_clim_reset_emits_once(mock_show, qtbot):
+    """Resetting the contrast limits should emit a single event"""
+    layer = Image(_IMAGE)
+    qtctrl = QtBaseImageControls(layer)
+    qtbot.addWidget(qtctrl)
+    layer.contrast_limits = (20, 40)
+    layer.contrast_limits_range = (20, 40)
+    qtbot.mousePress(qtctrl.contrastLimitsSlider, Qt.RightButton)
+
+    events = []
+    layer.events.contrast_limits.connect(events.append)
+    reset_button = qtctrl.clim_pop.findChild(QPushButton, "reset_clims_button")
+    reset_button.click()
+    assert len(events) == 1
+    assert tuple(layer.contrast_limits) == (0, 99)
+    assert tuple(layer.contrast_limits_range) == (0, 99)
+    assert tuple(qtctrl.contrastLimitsSlider.values()) == (0, 99)
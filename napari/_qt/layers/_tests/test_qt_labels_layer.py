@@ -0,0 +1,56 @@
+import numpy as np
+
+from napari._qt.layers.qt_labels_layer import QtColorBox, QtLabelsControls
+from napari._qt.utils import QImg2array
+from napari.layers import Labels
+
+
+def test_colorbox_paint(qtbot):
+    """The colorbox should show the selected label color or a checkerboard"""
+    layer = Labels(np.zeros((5, 5), dtype=int))
+    colorbox = QtColorBox(layer)
+    qtbot.addWidget(colorbox)
+
+    layer.selected_label = 0
+    arr = QImg2array(colorbox.grab().toImage())
+    assert arr[0, 0].tolist() == [230, 230, 230, 255]
+    assert arr[0, 4].tolist() == [25, 25, 25, 255]
+
+    layer.selected_label = 3
+    arr = QImg2array(colorbox.grab().toImage())
+    expected = (255 * layer._selected_color).astype(int)
+    np.testing.assert_allclose(arr[0, 0], expected, atol=1)
+    np.testing.assert_allclose(arr[-1, -1], expected, atol=1)
+
+
+def test_colorbox_skips_unchanged_color(qtbot):
+    """The colorbox should only repaint when the selected color changes"""
+    layer = Labels(np.zeros((5, 5), dtype=int))
+    colorbox = QtColorBox(layer)
+    qtbot.addWidget(colorbox)
+    layer.selected_label = 0
+    assert colorbox._color is None
+
+    # a new colormap does not change the background color
+    layer.new_colormap()
+    assert colorbox._color is None
+
+    layer.selected_label = 2
+    assert colorbox._color == tuple(layer._selected_color)
+
+
+def test_selection_spinbox_synced(qtbot):
+    """The spinbox should follow the layer without redundant updates"""
+    layer = Labels(np.zeros((5, 5), dtype=int))
+    qtctrl = QtLabelsControls(layer)
+    qtbot.addWidget(qtctrl)
+
+    layer.selected_label = 5
+    assert qtctrl.selectionSpinBox.value() == 5
+
+    with qtbot.assertNotEmitted(qtctrl.selectionSpinBox.valueChanged):
+        layer.new_colormap()
+    assert qtctrl.selectionSpinBox.value() == 5
+
+    qtctrl.selectionSpinBox.setValue(2)
+    assert layer.selected_label == 2
@@ -2,6 +2,11 @@ from qtpy.QtCore import Qt
 from qtpy.QtWidgets import QSlider, QGridLayout, QFrame, QComboBox
 
 from ...layers.base._base_constants import Blending
+from ..utils import qt_signals_blocked
+
+# blending modes listed in the combobox, and the index of each of them
+_BLENDING_MODES = tuple(Blending.keys())
+_BLENDING_INDEX = {blending: i for i, blending in enumerate(_BLENDING_MODES)}
 
 
 class QtLayerControls(QFrame):
@@ -52,11 +57,8 @@ class QtLayerControls(QFrame):
         self._on_opacity_change()
 
         blend_comboBox = QComboBox(self)
-        blend_comboBox.addItems(Blending.keys())
-        index = blend_comboBox.findText(
-            self.layer.blending, Qt.MatchFixedString
-        )
-        blend_comboBox.setCurrentIndex(index)
+        blend_comboBox.addItems(_BLENDING_MODES)
+        blend_comboBox.setCurrentIndex(_BLENDING_INDEX[self.layer.blending])
         blend_comboBox.activated[str].connect(self.changeBlending)
         self.blendComboBox = blend_comboBox
 
@@ -80,6 +82,9 @@ class QtLayerControls(QFrame):
         text : str
             Name of blending mode, eg: 'translucent', 'additive', 'opaque'.
         """
+        # activated is also emitted when the current mode is picked again
+        if text == self.layer.blending:
+            return
         self.layer.blending = text
 
     def _on_opacity_change(self, event=None):
@@ -90,8 +95,11 @@ class QtLayerControls(QFrame):
         event : qtpy.QtCore.QEvent, optional.
             Event from the Qt context, by default None.
         """
-        with self.layer.events.opacity.blocker():
-            self.opacitySlider.setValue(self.layer.opacity * 100)
+        value = round(self.layer.opacity * 100)
+        if self.opacitySlider.value() == value:
+            return
+        with qt_signals_blocked(self.opacitySlider):
+            self.opacitySlider.setValue(value)
 
     def _on_blending_change(self, event=None):
         """Receive layer model blending mode change event and update slider.
@@ -101,8 +109,8 @@ class QtLayerControls(QFrame):
         event : qtpy.QtCore.QEvent, optional.
             Event from the Qt context, by default None.
         """
-        with self.layer.events.blending.blocker():
-            index = self.blendComboBox.findText(
-                self.layer.blending, Qt.MatchFixedString
-            )
-            self.blendComboBox.setCurrentIndex(index)
+        index = _BLENDING_INDEX[self.layer.blending]
+        if self.blendComboBox.currentIndex() == index:
+            return
+        # setCurrentIndex does not emit activated, so changeBlending won't run
+        self.blendComboBox.setCurrentIndex(index)
@@ -2,13 +2,12 @@ from functools import partial
 from contextlib import suppress
 
 import numpy as np
-from qtpy.QtCore import Qt
-from qtpy.QtGui import QImage, QPixmap
+from qtpy.QtCore import Qt, QTimer
 from qtpy.QtWidgets import QComboBox, QLabel, QSlider, QPushButton
 
 from ..qt_range_slider import QHRangeSlider
 from ..qt_range_slider_popup import QRangeSliderPopup
-from ..utils import qt_signals_blocked
+from ..utils import qt_signals_blocked, rgba_array_to_pixmap
 from .qt_base_layer import QtLayerControls
 
 
@@ -77,6 +76,15 @@ class QtBaseImageControls(QtLayerControls):
         self.gammaSlider = sld
         self.gamma_slider_update()
 
+        # Changing gamma recomputes the layer thumbnail, so while the slider
+        # is being dragged only apply the latest value at most once a frame.
+        self._pending_gamma = None
+        self._gamma_timer = QTimer(self)
+        self._gamma_timer.setSingleShot(True)
+        self._gamma_timer.setInterval(16)
+        self._gamma_timer.timeout.connect(self._apply_gamma)
+        sld.sliderReleased.connect(self._apply_gamma)
+
         self.colorbarLabel = QLabel(parent=self)
         self.colorbarLabel.setObjectName('colorbar')
         self.colorbarLabel.setToolTip('Colorbar')
@@ -159,25 +167,39 @@ class QtBaseImageControls(QtLayerControls):
         if name != self.colormapComboBox.currentText():
             self.colormapComboBox.setCurrentText(name)
 
-        # Note that QImage expects the image width followed by height
-        image = QImage(
-            self.layer._colorbar,
-            self.layer._colorbar.shape[1],
-            self.layer._colorbar.shape[0],
-            QImage.Format_RGBA8888,
+        self.colorbarLabel.setPixmap(
+            rgba_array_to_pixmap(self.layer._colorbar)
         )
-        self.colorbarLabel.setPixmap(QPixmap.fromImage(image))
 
     def gamma_slider_changed(self, value):
         """Change gamma value on the layer model.
 
+        While the slider is being dragged the latest value is applied
+        asynchronously, at most once per timer interval, and flushed when
+        the slider is released. Otherwise it is applied immediately.
+
         Parameters
         ----------
         value : float
-            Gamma adjustment value.
+            Gamma adjustment value, in slider units (gamma * 100).
             https://en.wikipedia.org/wiki/Gamma_correction
         """
-        self.layer.gamma = value / 100
+        if not self.gammaSlider.isSliderDown():
+            self._gamma_timer.stop()
+            self._pending_gamma = None
+            self.layer.gamma = value / 100
+            return
+        self._pending_gamma = value
+        if not self._gamma_timer.isActive():
+            self._gamma_timer.start()
+
+    def _apply_gamma(self):
+        """Set the latest pending gamma value on the layer model."""
+        self._gamma_timer.stop()
+        if self._pending_gamma is None:
+            return
+        self.layer.gamma = self._pending_gamma / 100
+        self._pending_gamma = None
 
     def gamma_slider_update(self, event=None):
         """Receive the layer model gamma change event and update the slider.
@@ -274,8 +296,12 @@ def create_clim_reset_buttons(layer):
     """
 
     def reset():
-        layer.reset_contrast_limits()
-        layer.contrast_limits_range = layer.contrast_limits
+        # both writes below emit contrast_limits events, so block them and
+        # notify listeners once the limits and range are consistent again
+        with layer.events.contrast_limits.blocker():
+            layer.reset_contrast_limits()
+            layer.contrast_limits_range = layer.contrast_limits
+        layer.events.contrast_limits()
 
     def reset_range():
         layer.reset_contrast_limits_range()
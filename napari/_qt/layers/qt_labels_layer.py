@@ -16,7 +16,7 @@ import numpy as np
 from .qt_base_layer import QtLayerControls
 from ...layers.labels._labels_constants import Mode, LabelColorMode
 from ..qt_mode_buttons import QtModeRadioButton, QtModePushButton
-from ..utils import disable_with_opacity
+from ..utils import checkerboard_pixmap, disable_with_opacity
 
 
 class QtLabelsControls(QtLayerControls):
@@ -323,9 +323,12 @@ class QtLabelsControls(QtLayerControls):
         event : qtpy.QtCore.QEvent, optional.
             Event from the Qt context.
         """
+        value = int(self.layer.selected_label)
+        # selected_label is also emitted on colormap changes
+        if self.selectionSpinBox.value() == value:
+            return
         with self.layer.events.selected_label.blocker():
-            value = self.layer.selected_label
-            self.selectionSpinBox.setValue(int(value))
+            self.selectionSpinBox.setValue(value)
 
     def _on_brush_size_change(self, event=None):
         """Receive layer model brush size change event and update the slider.
@@ -419,9 +422,15 @@ class QtColorBox(QWidget):
         self.setFixedWidth(self._height)
         self.setFixedHeight(self._height)
         self.setToolTip('Selected label color')
+        self._color = self._current_color()
 
         self.layer.events.selected_label.connect(self.update_color)
 
+    def _current_color(self):
+        """Return the selected label color as a tuple of floats, or None."""
+        color = self.layer._selected_color
+        return None if color is None else tuple(map(float, color))
+
     def update_color(self, event):
         """Receive layer model label selection change event & update colorbox.
 
@@ -430,6 +439,12 @@ class QtColorBox(QWidget):
         event : qtpy.QtCore.QEvent
             Event from the Qt context.
         """
+        # selected_label is also emitted on colormap changes, which often
+        # leave the selected color untouched
+        color = self._current_color()
+        if color == self._color:
+            return
+        self._color = color
         self.update()
 
     def paintEvent(self, event):
@@ -441,21 +456,8 @@ class QtColorBox(QWidget):
             Event from the Qt context.
         """
         painter = QPainter(self)
-        if self.layer._selected_color is None:
-            for i in range(self._height // 4):
-                for j in range(self._height // 4):
-                    if (i % 2 == 0 and j % 2 == 0) or (
-                        i % 2 == 1 and j % 2 == 1
-                    ):
-                        painter.setPen(QColor(230, 230, 230))
-                        painter.setBrush(QColor(230, 230, 230))
-                    else:
-                        painter.setPen(QColor(25, 25, 25))
-                        painter.setBrush(QColor(25, 25, 25))
-                    painter.drawRect(i * 4, j * 4, 5, 5)
+        if self._color is None:
+            painter.drawPixmap(0, 0, checkerboard_pixmap(self._height))
         else:
-            color = 255 * self.layer._selected_color
-            color = color.astype(int)
-            painter.setPen(QColor(*list(color)))
-            painter.setBrush(QColor(*list(color)))
-            painter.drawRect(0, 0, self._height, self._height)
+            color = QColor.fromRgbF(*self._color)
+            painter.fillRect(0, 0, self._height, self._height, color)
@@ -147,6 +147,20 @@ class QtShapesControls(QtLayerControls):
             tooltip='Delete selected shapes',
         )
 
+        # mapping of layer mode to button, used to sync the checked button
+        self._mode_buttons = {
+            Mode.SELECT: self.select_button,
+            Mode.DIRECT: self.direct_button,
+            Mode.PAN_ZOOM: self.panzoom_button,
+            Mode.ADD_RECTANGLE: self.rectangle_button,
+            Mode.ADD_ELLIPSE: self.ellipse_button,
+            Mode.ADD_LINE: self.line_button,
+            Mode.ADD_PATH: self.path_button,
+            Mode.ADD_POLYGON: self.polygon_button,
+            Mode.VERTEX_INSERT: self.vertex_insert_button,
+            Mode.VERTEX_REMOVE: self.vertex_remove_button,
+        }
+
         self.button_group = QButtonGroup(self)
         self.button_group.addButton(self.select_button)
         self.button_group.addButton(self.direct_button)
@@ -242,21 +256,8 @@ class QtShapesControls(QtLayerControls):
         ValueError
             Raise error if event.mode is not ADD, PAN_ZOOM, or SELECT.
         """
-        mode_buttons = {
-            Mode.SELECT: self.select_button,
-            Mode.DIRECT: self.direct_button,
-            Mode.PAN_ZOOM: self.panzoom_button,
-            Mode.ADD_RECTANGLE: self.rectangle_button,
-            Mode.ADD_ELLIPSE: self.ellipse_button,
-            Mode.ADD_LINE: self.line_button,
-            Mode.ADD_PATH: self.path_button,
-            Mode.ADD_POLYGON: self.polygon_button,
-            Mode.VERTEX_INSERT: self.vertex_insert_button,
-            Mode.VERTEX_REMOVE: self.vertex_remove_button,
-        }
-
-        if event.mode in mode_buttons:
-            mode_buttons[event.mode].setChecked(True)
+        if event.mode in self._mode_buttons:
+            self._mode_buttons[event.mode].setChecked(True)
         else:
             raise ValueError(f"Mode '{event.mode}'not recognized")
 
@@ -294,18 +295,6 @@ class QtShapesControls(QtLayerControls):
         """
         self.layer.current_edge_width = float(value) / 2
 
-    def changeOpacity(self, value):
-        """Change opacity value of shapes on the layer model.
-
-        Parameters
-        ----------
-        value : float
-            Opacity value for shapes.
-            Input range 0 - 100 (transparent to fully opaque).
-        """
-        with self.layer.events.blocker(self._on_opacity_change):
-            self.layer.opacity = value / 100
-
     def _on_edge_width_change(self, event=None):
         """Receive layer model edge line width change event and update slider.
 
@@ -341,17 +330,6 @@ class QtShapesControls(QtLayerControls):
         with qt_signals_blocked(self.faceColorEdit):
             self.faceColorEdit.setColor(self.layer.current_face_color)
 
-    def _on_opacity_change(self, event=None):
-        """Receive layer model opacity change event and update opacity slider.
-
-        Parameters
-        ----------
-        event : qtpy.QtCore.QEvent, optional.
-            Event from the Qt context, by default None.
-        """
-        with self.layer.events.opacity.blocker():
-            self.opacitySlider.setValue(self.layer.opacity * 100)
-
     def _on_editable_change(self, event=None):
         """Receive layer model editable change event & enable/disable buttons.
 
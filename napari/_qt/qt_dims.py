@@ -1,7 +1,6 @@
 import warnings
 from typing import Optional, Tuple
 
-import numpy as np
 from qtpy.QtGui import QFont, QFontMetrics
 from qtpy.QtWidgets import QLineEdit, QSizePolicy, QVBoxLayout, QWidget
 
@@ -44,6 +43,9 @@ class QtDims(QWidget):
         self._displayed_sliders = []
 
         self._last_used = None
+        self._slice_label_width = None
+        # font metrics used to size the axis and slice labels
+        self._font_metrics = QFontMetrics(QFont("", 0))
         self._play_ready = True  # False if currently awaiting a draw event
         self._animation_thread = None
 
@@ -137,7 +139,7 @@ class QtDims(QWidget):
             return
 
         self.slider_widgets[axis]._update_range()
-        nsliders = np.sum(self._displayed_sliders)
+        nsliders = sum(self._displayed_sliders)
         self.setMinimumHeight(nsliders * self.SLIDERHEIGHT)
         self._resize_slice_labels()
 
@@ -152,10 +154,14 @@ class QtDims(QWidget):
         event : qtpy.QtCore.QEvent, optional
             Event from the Qt context, by default None.
         """
+        # dims.range and dims.displayed build new sequences on every access
+        ranges = self.dims.range
+        displayed = self.dims.displayed
         widgets = reversed(list(enumerate(self.slider_widgets)))
         for (axis, widget) in widgets:
-            _range = self.dims.range[axis][1] - self.dims.range[axis][2]
-            if axis in self.dims.displayed or _range == 0:
+            _, _max, _step = ranges[axis]
+            _range = _max - _step
+            if axis in displayed or _range == 0:
                 # Displayed dimensions correspond to non displayed sliders
                 self._displayed_sliders[axis] = False
                 self.last_used = None
@@ -165,7 +171,7 @@ class QtDims(QWidget):
                 self._displayed_sliders[axis] = True
                 self.last_used = axis
                 widget.show()
-        nsliders = np.sum(self._displayed_sliders)
+        nsliders = sum(self._displayed_sliders)
         self.setMinimumHeight(nsliders * self.SLIDERHEIGHT)
         self._resize_slice_labels()
 
@@ -194,7 +200,7 @@ class QtDims(QWidget):
         left-aligned and allows the full label to be visible at all times,
         with minimal space, without setting stretch on the layout.
         """
-        fm = QFontMetrics(QFont("", 0))
+        fm = self._font_metrics
         labels = self.findChildren(QLineEdit, 'axis_label')
         newwidth = max([fm.boundingRect(lab.text()).width() for lab in labels])
 
@@ -217,8 +223,13 @@ class QtDims(QWidget):
                 length = len(str(int(maxi)))
                 if length > width:
                     width = length
+        # This runs on every range change, but the labels only need resizing
+        # when the number of digits changes or new sliders were created
+        if width == self._slice_label_width:
+            return
+        self._slice_label_width = width
         # gui width of a string of length `width`
-        fm = QFontMetrics(QFont("", 0))
+        fm = self._font_metrics
         width = fm.boundingRect("8" * width).width()
         for labl in self.findChildren(QWidget, 'slice_label'):
             labl.setFixedWidth(width + 6)
@@ -240,8 +251,9 @@ class QtDims(QWidget):
             slider_widget.play_button.play_requested.connect(self.play)
             self.layout().addWidget(slider_widget)
             self.slider_widgets.insert(0, slider_widget)
+            self._slice_label_width = None
             self._displayed_sliders.insert(0, True)
-            nsliders = np.sum(self._displayed_sliders)
+            nsliders = sum(self._displayed_sliders)
             self.setMinimumHeight(nsliders * self.SLIDERHEIGHT)
         self._resize_axis_labels()
 
@@ -271,13 +283,13 @@ class QtDims(QWidget):
         self._displayed_sliders.pop(index)
         self.layout().removeWidget(slider_widget)
         slider_widget.deleteLater()
-        nsliders = np.sum(self._displayed_sliders)
+        nsliders = sum(self._displayed_sliders)
         self.setMinimumHeight(int(nsliders * self.SLIDERHEIGHT))
         self.last_used = None
 
     def focus_up(self):
         """Shift focused dimension slider to be the next slider above."""
-        displayed = list(np.nonzero(self._displayed_sliders)[0])
+        displayed = [i for i, d in enumerate(self._displayed_sliders) if d]
         if len(displayed) == 0:
             return
 
@@ -289,7 +301,7 @@ class QtDims(QWidget):
 
     def focus_down(self):
         """Shift focused dimension slider to be the next slider bellow."""
-        displayed = list(np.nonzero(self._displayed_sliders)[0])
+        displayed = [i for i, d in enumerate(self._displayed_sliders) if d]
         if len(displayed) == 0:
             return
 
@@ -1,5 +1,6 @@
+from bisect import bisect_right
+
 from qtpy.QtCore import Qt, QMimeData, QTimer
-from qtpy.QtGui import QImage, QPixmap
 from qtpy.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -15,6 +16,8 @@ from qtpy.QtWidgets import (
 from qtpy.QtGui import QDrag
 import numpy as np
 
+from .utils import rgba_array_to_pixmap
+
 
 class QtLayerList(QScrollArea):
     """Widget storing a list of all the layers present in the current window.
@@ -120,20 +123,16 @@ class QtLayerList(QScrollArea):
         widgets = [
             self.vbox_layout.itemAt(i + 1).widget() for i in range(2 * total)
         ]
-        # Take every other widget to ignore the dividers and get just the
-        # property widgets
-        indices = [
-            self.layers.index(w.layer)
-            for i, w in enumerate(widgets)
-            if i % 2 == 0
-        ]
+        # Take every other widget to ignore the dividers and map each layer
+        # to its property widget and the divider that follows it
+        layer_widgets = {
+            id(widgets[i].layer): (widgets[i], widgets[i + 1])
+            for i in range(0, 2 * total, 2)
+        }
 
         # Move through the layers in order
-        for i in range(total):
-            # Find index of property widget in list of the current layer
-            index = 2 * indices.index(i)
-            widget = widgets[index]
-            divider = widgets[index + 1]
+        for i, layer in enumerate(self.layers):
+            widget, divider = layer_widgets[id(layer)]
             # Check if current index does not match new index
             index_current = self.vbox_layout.indexOf(widget)
             index_new = 2 * (total - i) - 1
@@ -308,6 +307,23 @@ class QtLayerList(QScrollArea):
             layer = self.layers[index]
             self._ensure_visible(layer)
 
+    def _divider_index(self, y):
+        """Find the index of the divider closest to a vertical position.
+
+        Parameters
+        ----------
+        y : int
+            Vertical position in viewport coordinates.
+
+        Returns
+        -------
+        int
+            Index of the first widget center below ``y``.
+        """
+        cord = y + self.verticalScrollBar().value()
+        # Centers are computed top to bottom, so they are already sorted
+        return bisect_right(self.centers, cord)
+
     def dragLeaveEvent(self, event):
         """Unselects layer dividers.
 
@@ -381,9 +397,7 @@ class QtLayerList(QScrollArea):
             self._drag_timer.stop()
 
         # Determine which widget center is the mouse currently closed to
-        cord = event.pos().y() + self.verticalScrollBar().value()
-        center_list = (i for i, x in enumerate(self.centers) if x > cord)
-        divider_index = next(center_list, len(self.centers))
+        divider_index = self._divider_index(event.pos().y())
         # Determine the current location of the widget being dragged
         total = self.vbox_layout.count() // 2 - 1
         insert = total - divider_index
@@ -411,9 +425,7 @@ class QtLayerList(QScrollArea):
 
         for i in range(0, self.vbox_layout.count(), 2):
             self.vbox_layout.itemAt(i).widget().setSelected(False)
-        cord = event.pos().y() + self.verticalScrollBar().value()
-        center_list = (i for i, x in enumerate(self.centers) if x > cord)
-        divider_index = next(center_list, len(self.centers))
+        divider_index = self._divider_index(event.pos().y())
         total = self.vbox_layout.count() // 2 - 1
         insert = total - divider_index
         index = self.layers.index(self._drag_name)
@@ -496,7 +508,15 @@ class QtLayerWidget(QFrame):
         tb.setObjectName('thumbnail')
         tb.setToolTip('Layer thumbnail')
         self.thumbnailLabel = tb
-        self._on_thumbnail_change()
+        self._thumbnail = None
+        self._refresh_thumbnail()
+
+        # Bursts of thumbnail events (e.g. during playback) are coalesced
+        # into a single refresh per turn of the event loop.
+        self._thumbnail_timer = QTimer(self)
+        self._thumbnail_timer.setSingleShot(True)
+        self._thumbnail_timer.setInterval(0)
+        self._thumbnail_timer.timeout.connect(self._refresh_thumbnail)
         self.layout.addWidget(tb)
 
         cb = QCheckBox(self)
@@ -623,23 +643,30 @@ class QtLayerWidget(QFrame):
         event : qtpy.QtCore.QEvent, optional
             Event from the Qt context.
         """
+        if self.visibleCheckBox.isChecked() == self.layer.visible:
+            return
         with self.layer.events.visible.blocker():
             self.visibleCheckBox.setChecked(self.layer.visible)
 
     def _on_thumbnail_change(self, event=None):
-        """Update thumbnail image on the layer widget.
+        """Schedule an update of the thumbnail image on the layer widget.
 
         Parameters
         ----------
         event : qtpy.QtCore.QEvent, optional
             Event from the Qt context.
         """
+        if not self._thumbnail_timer.isActive():
+            self._thumbnail_timer.start()
+
+    def _refresh_thumbnail(self):
+        """Update thumbnail image on the layer widget."""
         thumbnail = self.layer.thumbnail
-        # Note that QImage expects the image width followed by height
-        image = QImage(
-            thumbnail,
-            thumbnail.shape[1],
-            thumbnail.shape[0],
-            QImage.Format_RGBA8888,
-        )
-        self.thumbnailLabel.setPixmap(QPixmap.fromImage(image))
+        # Thumbnail events are emitted on every refresh, often with identical
+        # content, so only rebuild the pixmap when the thumbnail has changed.
+        if self._thumbnail is not None and np.array_equal(
+            thumbnail, self._thumbnail
+        ):
+            return
+        self._thumbnail = thumbnail
+        self.thumbnailLabel.setPixmap(rgba_array_to_pixmap(thumbnail))
@@ -4,8 +4,8 @@ from typing import Sequence, Union
 
 import numpy as np
 from qtpy import API_NAME
-from qtpy.QtCore import QSize, Qt
-from qtpy.QtGui import QCursor, QDrag, QImage, QPainter, QPixmap
+from qtpy.QtCore import QRect, QSize, Qt
+from qtpy.QtGui import QColor, QCursor, QDrag, QImage, QPainter, QPixmap
 from qtpy.QtWidgets import (
     QGraphicsOpacityEffect,
     QHBoxLayout,
@@ -32,9 +32,11 @@ def QImg2array(img):
         Numpy array of type ubyte and shape (h, w, 4). Index [0, 0] is the
         upper-left corner of the rendered region.
     """
-    # Fix when  image is provided in wrong format (ex. test on Azure pipelines)
-    if img.format() != QImage.Format_ARGB32:
-        img = img.convertToFormat(QImage.Format_ARGB32)
+    # Grabs are usually ARGB32_Premultiplied, so converting to
+    # non-premultiplied RGBA8888 (channels already in RGBA byte order) is the
+    # normal path, not a fallback
+    if img.format() != QImage.Format_RGBA8888:
+        img = img.convertToFormat(QImage.Format_RGBA8888)
     b = img.constBits()
     h, w, c = img.height(), img.width(), 4
 
@@ -45,14 +47,35 @@ def QImg2array(img):
         arr = np.array(b).reshape(h, w, c)
     else:
         b.setsize(h * w * c)
-        arr = np.frombuffer(b, np.uint8).reshape(h, w, c)
-
-    # Format of QImage is ARGB32_Premultiplied, but color channels are
-    # reversed.
-    arr = arr[:, :, [2, 1, 0, 3]]
+        # copy, as the buffer is released along with `img`
+        arr = np.frombuffer(b, np.uint8).reshape(h, w, c).copy()
     return arr
 
 
+def rgba_array_to_pixmap(arr):
+    """Convert an RGBA array to a QPixmap.
+
+    Parameters
+    ----------
+    arr : array
+        Array of type ubyte and shape (h, w, 4).
+
+    Returns
+    -------
+    pixmap : qtpy.QtGui.QPixmap
+        Pixmap holding its own copy of the image data.
+    """
+    # QImage only wraps the buffer, so it must be C-contiguous with an
+    # explicit row stride, and the pixmap must be made before the array
+    # can be released. Note that QImage expects the image width followed
+    # by height
+    arr = np.ascontiguousarray(arr)
+    image = QImage(
+        arr, arr.shape[1], arr.shape[0], arr.strides[0], QImage.Format_RGBA8888
+    )
+    return QPixmap.fromImage(image)
+
+
 @contextmanager
 def qt_signals_blocked(obj):
     """Context manager to temporarily block signals from `obj`"""
@@ -63,12 +86,20 @@ def qt_signals_blocked(obj):
 
 def disable_with_opacity(obj, widget_list, disabled):
     """Set enabled state on a list of widgets. If disabled, decrease opacity"""
+    enabled = obj.layer.editable
     for wdg in widget_list:
         widget = getattr(obj, wdg)
-        widget.setEnabled(obj.layer.editable)
-        op = QGraphicsOpacityEffect(obj)
-        op.setOpacity(1 if obj.layer.editable else 0.5)
-        widget.setGraphicsEffect(op)
+        widget.setEnabled(enabled)
+        # the effect is created the first time a widget is dimmed, and is
+        # then only switched on and off
+        op = widget.graphicsEffect()
+        if op is None:
+            if enabled:
+                continue
+            op = QGraphicsOpacityEffect(widget)
+            op.setOpacity(0.5)
+            widget.setGraphicsEffect(op)
+        op.setEnabled(not enabled)
 
 
 @lru_cache(maxsize=64)
@@ -85,6 +116,20 @@ def square_pixmap(size):
     return pixmap
 
 
+@lru_cache(maxsize=64)
+def checkerboard_pixmap(size, tile=4):
+    """Create a light/dark checkerboard pixmap. For use as empty color."""
+    pixmap = QPixmap(QSize(size, size))
+    pixmap.fill(QColor(25, 25, 25))
+    painter = QPainter(pixmap)
+    light = QColor(230, 230, 230)
+    for i in range(0, size, tile):
+        for j in range(i % (2 * tile), size, 2 * tile):
+            painter.fillRect(i, j, tile, tile, light)
+    painter.end()
+    return pixmap
+
+
 def drag_with_pixmap(list_widget: QListWidget) -> QDrag:
     """Create a QDrag object with a pixmap of the currently select list item.
 
@@ -114,16 +159,25 @@ def drag_with_pixmap(list_widget: QListWidget) -> QDrag:
     """
     drag = QDrag(list_widget)
     drag.setMimeData(list_widget.mimeData(list_widget.selectedItems()))
-    size = list_widget.viewport().visibleRegion().boundingRect().size()
-    pixmap = QPixmap(size)
-    pixmap.fill(Qt.transparent)
-    painter = QPainter(pixmap)
-    for index in list_widget.selectedIndexes():
-        rect = list_widget.visualRect(index)
-        painter.drawPixmap(rect, list_widget.viewport().grab(rect))
-    painter.end()
+    viewport = list_widget.viewport()
+    rects = [list_widget.visualRect(i) for i in list_widget.selectedIndexes()]
+    # only paint the region covered by the selected items
+    bounds = QRect()
+    for rect in rects:
+        bounds = bounds.united(rect)
+    bounds = bounds.intersected(viewport.rect())
+    if len(rects) == 1:
+        pixmap = viewport.grab(bounds)
+    else:
+        pixmap = QPixmap(bounds.size())
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        for rect in rects:
+            target = rect.translated(-bounds.topLeft())
+            painter.drawPixmap(target, viewport.grab(rect))
+        painter.end()
     drag.setPixmap(pixmap)
-    drag.setHotSpot(list_widget.viewport().mapFromGlobal(QCursor.pos()))
+    drag.setHotSpot(viewport.mapFromGlobal(QCursor.pos()) - bounds.topLeft())
     return drag
 
 
@@ -7,8 +7,7 @@ def test_nbscreenshot(make_test_viewer):
     """Test taking a screenshot."""
     viewer = make_test_viewer()
 
-    np.random.seed(0)
-    data = np.random.random((10, 15))
+    data = np.random.default_rng(0).random((10, 15))
     viewer.add_image(data)
 
     rich_display_object = nbscreenshot(viewer)
@@ -157,3 +157,37 @@ def test_image_screenshot_zoomed(make_test_viewer):
     np.testing.assert_allclose(
         screenshot[-screen_offset, -screen_offset], target_center
     )
+
+
+def test_multiscale_idle_draw(make_test_viewer, monkeypatch):
+    """Test idle redraws skip the multiscale level update."""
+    viewer = make_test_viewer()
+    shapes = [(4000, 3000), (2000, 1500), (1000, 750), (500, 375)]
+    data = [np.zeros(s) for s in shapes]
+    layer = viewer.add_image(data, multiscale=True, contrast_limits=[0, 1])
+    visual = viewer.window.qt_viewer.layer_to_visual[layer]
+    viewer.window.qt_viewer.view.canvas.size = (800, 600)
+    visual.on_draw(None)
+    visual.on_draw(None)
+
+    calls = []
+    update = layer._update_multiscale
+    monkeypatch.setattr(
+        layer,
+        '_update_multiscale',
+        lambda **kwargs: calls.append(1) or update(**kwargs),
+    )
+    visual.on_draw(None)
+    assert calls == []
+
+    viewer.window.qt_viewer.view.canvas.size = (400, 300)
+    visual.on_draw(None)
+    assert calls == [1]
+
+    # replacing the pyramid must trigger a fresh level selection even
+    # though the canvas size and data level are unchanged
+    small_shapes = [(400, 300), (200, 150), (100, 75), (50, 37)]
+    layer.data = [np.zeros(s) for s in small_shapes]
+    visual.on_draw(None)
+    assert calls == [1, 1]
+    assert layer.data_level == 0
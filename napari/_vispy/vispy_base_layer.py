@@ -53,9 +53,13 @@ class VispyBaseLayer(ABC):
         self.MAX_TEXTURE_SIZE_3D = MAX_TEXTURE_SIZE_3D
 
         self._position = (0,) * self.layer.dims.ndisplay
+        # canvas size, displayed dims and data level seen by the last
+        # multiscale update, reset whenever the layer data is replaced
+        self._multiscale_state = None
 
         self.layer.events.refresh.connect(lambda e: self.node.update())
         self.layer.events.set_data.connect(self._on_data_change)
+        self.layer.events.data.connect(self._reset_multiscale_state)
         self.layer.events.visible.connect(self._on_visible_change)
         self.layer.events.opacity.connect(self._on_opacity_change)
         self.layer.events.blending.connect(self._on_blending_change)
@@ -137,6 +141,9 @@ class VispyBaseLayer(ABC):
     def _on_data_change(self, event=None):
         raise NotImplementedError()
 
+    def _reset_multiscale_state(self, event=None):
+        self._multiscale_state = None
+
     def _on_visible_change(self, event=None):
         self.node.visible = self.layer.visible
 
@@ -208,11 +215,14 @@ class VispyBaseLayer(ABC):
         nd = self.layer.dims.ndisplay
         # Find image coordinate of top left canvas pixel
         if self.node.canvas is not None:
+            # Map both corners with a single transform, offsetting so that
+            # pixel center is at 0, and flip to image axis ordering
+            transform = self.node.canvas.scene.node_transform(self.node)
+            corners = transform.map([[0, 0], list(self.node.canvas.size)])
+            corners = corners[:, nd - 1 :: -1] - 0.5
             offset = self.translate[:nd] / self.scale[:nd]
-            tl_raw = np.floor(self._transform_position([0, 0]) + offset[::-1])
-            br_raw = np.ceil(
-                self._transform_position(self.node.canvas.size) + offset[::-1]
-            )
+            tl_raw = np.floor(corners[0] + offset[::-1])
+            br_raw = np.ceil(corners[1] + offset[::-1])
         else:
             tl_raw = [0] * nd
             br_raw = [1] * nd
@@ -241,10 +251,22 @@ class VispyBaseLayer(ABC):
             and self.layer.dims.ndisplay == 2
             and self.node.canvas is not None
         ):
+            # Nothing new can be requested if the view and level are the same
+            # as on the previous draw, as happens on idle redraws
+            state = (
+                self.node.canvas.size,
+                tuple(self.layer.dims.displayed),
+                self.layer.data_level,
+            )
+            if state == self._multiscale_state and np.array_equal(
+                old_corner_pixels, self.layer.corner_pixels
+            ):
+                return
             self.layer._update_multiscale(
                 corner_pixels=old_corner_pixels,
                 shape_threshold=self.node.canvas.size,
             )
+            self._multiscale_state = state
 
 
 @lru_cache()
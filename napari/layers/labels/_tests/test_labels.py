@@ -1,13 +1,28 @@
 import numpy as np
+import pytest
 from vispy.color import Colormap
 from napari.layers import Labels
 
 
-def test_random_labels():
+@pytest.fixture(scope="session")
+def small_random_labels():
+    """Read-only random 2D labels data, shared between tests."""
+    rng = np.random.RandomState(0)
+    data = rng.randint(20, size=(10, 15))
+    data.flags.writeable = False
+    return data
+
+
+@pytest.fixture(scope="module")
+def small_random_labels_layer(small_random_labels):
+    """Labels layer shared between tests that only read from it."""
+    return Labels(small_random_labels)
+
+
+def test_random_labels(small_random_labels):
     """Test instantiating Labels layer with random 2D data."""
     shape = (10, 15)
-    np.random.seed(0)
-    data = np.random.randint(20, size=shape)
+    data = small_random_labels
     layer = Labels(data)
     assert np.all(layer.data == data)
     assert layer.ndim == len(shape)
@@ -31,8 +46,8 @@ def test_all_zeros_labels():
 def test_3D_labels():
     """Test instantiating Labels layer with random 3D data."""
     shape = (6, 10, 15)
-    np.random.seed(0)
-    data = np.random.randint(20, size=shape)
+    rng = np.random.RandomState(0)
+    data = rng.randint(20, size=shape)
     layer = Labels(data)
     assert np.all(layer.data == data)
     assert layer.ndim == len(shape)
@@ -50,9 +65,9 @@ def test_changing_labels():
     """Test changing Labels data."""
     shape_a = (10, 15)
     shape_b = (20, 12)
-    np.random.seed(0)
-    data_a = np.random.randint(20, size=shape_a)
-    data_b = np.random.randint(20, size=shape_b)
+    rng = np.random.RandomState(0)
+    data_a = rng.randint(20, size=shape_a)
+    data_b = rng.randint(20, size=shape_b)
     layer = Labels(data_a)
     layer.data = data_b
     assert np.all(layer.data == data_b)
@@ -66,9 +81,9 @@ def test_changing_labels_dims():
     """Test changing Labels data including dimensionality."""
     shape_a = (10, 15)
     shape_b = (20, 12, 6)
-    np.random.seed(0)
-    data_a = np.random.randint(20, size=shape_a)
-    data_b = np.random.randint(20, size=shape_b)
+    rng = np.random.RandomState(0)
+    data_a = rng.randint(20, size=shape_a)
+    data_b = rng.randint(20, size=shape_b)
     layer = Labels(data_a)
 
     layer.data = data_b
@@ -79,30 +94,30 @@ def test_changing_labels_dims():
     assert layer._data_view.shape == shape_b[-2:]
 
 
-def test_changing_modes():
+@pytest.mark.parametrize(
+    'mode, interactive',
+    [
+        ('fill', False),
+        ('paint', False),
+        ('pick', False),
+        ('erase', False),
+        ('pan_zoom', True),
+    ],
+)
+def test_changing_modes(small_random_labels, mode, interactive):
     """Test changing modes."""
-    np.random.seed(0)
-    data = np.random.randint(20, size=(10, 15))
-    layer = Labels(data)
+    layer = Labels(small_random_labels)
     assert layer.mode == 'pan_zoom'
     assert layer.interactive is True
 
-    layer.mode = 'fill'
-    assert layer.mode == 'fill'
-    assert layer.interactive is False
+    layer.mode = mode
+    assert layer.mode == mode
+    assert layer.interactive is interactive
 
-    layer.mode = 'paint'
-    assert layer.mode == 'paint'
-    assert layer.interactive is False
-
-    layer.mode = 'pick'
-    assert layer.mode == 'pick'
-    assert layer.interactive is False
-
-    layer.mode = 'pan_zoom'
-    assert layer.mode == 'pan_zoom'
-    assert layer.interactive is True
 
+def test_not_editable_forces_pan_zoom(small_random_labels):
+    """Test making the layer non-editable switches back to pan_zoom mode."""
+    layer = Labels(small_random_labels)
     layer.mode = 'paint'
     assert layer.mode == 'paint'
     layer.editable = False
@@ -110,10 +125,9 @@ def test_changing_modes():
     assert layer.editable is False
 
 
-def test_name():
+def test_name(small_random_labels):
     """Test setting layer name."""
-    np.random.seed(0)
-    data = np.random.randint(20, size=(10, 15))
+    data = small_random_labels
     layer = Labels(data)
     assert layer.name == 'Labels'
 
@@ -124,10 +138,9 @@ def test_name():
     assert layer.name == 'lbls'
 
 
-def test_visiblity():
+def test_visiblity(small_random_labels):
     """Test setting layer visiblity."""
-    np.random.seed(0)
-    data = np.random.randint(20, size=(10, 15))
+    data = small_random_labels
     layer = Labels(data)
     assert layer.visible is True
 
@@ -141,10 +154,9 @@ def test_visiblity():
     assert layer.visible is True
 
 
-def test_opacity():
+def test_opacity(small_random_labels):
     """Test setting layer opacity."""
-    np.random.seed(0)
-    data = np.random.randint(20, size=(10, 15))
+    data = small_random_labels
     layer = Labels(data)
     assert layer.opacity == 0.7
 
@@ -158,10 +170,9 @@ def test_opacity():
     assert layer.opacity == 0.3
 
 
-def test_blending():
+def test_blending(small_random_labels):
     """Test setting layer blending."""
-    np.random.seed(0)
-    data = np.random.randint(20, size=(10, 15))
+    data = small_random_labels
     layer = Labels(data)
     assert layer.blending == 'translucent'
 
@@ -175,10 +186,9 @@ def test_blending():
     assert layer.blending == 'opaque'
 
 
-def test_seed():
+def test_seed(small_random_labels):
     """Test setting seed."""
-    np.random.seed(0)
-    data = np.random.randint(20, size=(10, 15))
+    data = small_random_labels
     layer = Labels(data)
     assert layer.seed == 0.5
 
@@ -189,10 +199,9 @@ def test_seed():
     assert layer.seed == 0.7
 
 
-def test_num_colors():
+def test_num_colors(small_random_labels):
     """Test setting number of colors in colormap."""
-    np.random.seed(0)
-    data = np.random.randint(20, size=(10, 15))
+    data = small_random_labels
     layer = Labels(data)
     assert layer.num_colors == 50
 
@@ -203,10 +212,9 @@ def test_num_colors():
     assert layer.num_colors == 60
 
 
-def test_properties():
+def test_properties(small_random_labels):
     """Test adding labels with properties."""
-    np.random.seed(0)
-    data = np.random.randint(20, size=(10, 15))
+    data = small_random_labels
 
     layer = Labels(data)
     assert isinstance(layer.properties, dict)
@@ -236,10 +244,9 @@ def test_properties():
     assert layer_message.endswith('Class 12')
 
 
-def test_colormap():
+def test_colormap(small_random_labels):
     """Test colormap."""
-    np.random.seed(0)
-    data = np.random.randint(20, size=(10, 15))
+    data = small_random_labels
     layer = Labels(data)
     assert type(layer.colormap) == tuple
     assert layer.colormap[0] == 'random'
@@ -251,10 +258,9 @@ def test_colormap():
     assert type(layer.colormap[1]) == Colormap
 
 
-def test_custom_color_dict():
+def test_custom_color_dict(small_random_labels):
     """Test custom color dict."""
-    np.random.seed(0)
-    data = np.random.randint(20, size=(10, 15))
+    data = small_random_labels
     layer = Labels(data, color={1: 'white'})
 
     # test with custom color dict
@@ -268,10 +274,9 @@ def test_custom_color_dict():
     assert not (layer.get_color(1) == np.array([1.0, 1.0, 1.0, 1.0])).all()
 
 
-def test_metadata():
+def test_metadata(small_random_labels):
     """Test setting labels metadata."""
-    np.random.seed(0)
-    data = np.random.randint(20, size=(10, 15))
+    data = small_random_labels
     layer = Labels(data)
     assert layer.metadata == {}
 
@@ -279,10 +284,9 @@ def test_metadata():
     assert layer.metadata == {'unit': 'cm'}
 
 
-def test_brush_size():
+def test_brush_size(small_random_labels):
     """Test changing brush size."""
-    np.random.seed(0)
-    data = np.random.randint(20, size=(10, 15))
+    data = small_random_labels
     layer = Labels(data)
     assert layer.brush_size == 10
 
@@ -290,10 +294,9 @@ def test_brush_size():
     assert layer.brush_size == 20
 
 
-def test_contiguous():
+def test_contiguous(small_random_labels):
     """Test changing contiguous."""
-    np.random.seed(0)
-    data = np.random.randint(20, size=(10, 15))
+    data = small_random_labels
     layer = Labels(data)
     assert layer.contiguous is True
 
@@ -301,10 +304,9 @@ def test_contiguous():
     assert layer.contiguous is False
 
 
-def test_n_dimensional():
+def test_n_dimensional(small_random_labels):
     """Test changing n_dimensional."""
-    np.random.seed(0)
-    data = np.random.randint(20, size=(10, 15))
+    data = small_random_labels
     layer = Labels(data)
     assert layer.n_dimensional is False
 
@@ -312,10 +314,9 @@ def test_n_dimensional():
     assert layer.n_dimensional is True
 
 
-def test_selecting_label():
+def test_selecting_label(small_random_labels):
     """Test selecting label."""
-    np.random.seed(0)
-    data = np.random.randint(20, size=(10, 15))
+    data = small_random_labels
     layer = Labels(data)
     assert layer.selected_label == 1
     assert (layer._selected_color == layer.get_color(1)).all
@@ -325,11 +326,9 @@ def test_selecting_label():
     assert len(layer._selected_color) == 4
 
 
-def test_label_color():
+def test_label_color(small_random_labels_layer):
     """Test getting label color."""
-    np.random.seed(0)
-    data = np.random.randint(20, size=(10, 15))
-    layer = Labels(data)
+    layer = small_random_labels_layer
     col = layer.get_color(0)
     assert col is None
 
@@ -337,85 +336,78 @@ def test_label_color():
     assert len(col) == 4
 
 
-def test_paint():
+@pytest.mark.parametrize(
+    'brush_size, painted, untouched',
+    [
+        (9, np.s_[:5, :5], np.s_[5:10, 5:10]),
+        (10, np.s_[:6, :6], np.s_[6:10, 6:10]),
+        (19, np.s_[:10, :10], None),
+    ],
+)
+def test_paint(brush_size, painted, untouched):
     """Test painting labels with different brush sizes."""
-    np.random.seed(0)
-    data = np.random.randint(20, size=(10, 15))
+    rng = np.random.RandomState(0)
+    data = rng.randint(20, size=(10, 15))
     data[:10, :10] = 1
     layer = Labels(data)
-    assert np.unique(layer.data[:5, :5]) == 1
-    assert np.unique(layer.data[5:10, 5:10]) == 1
+    assert np.array_equiv(layer.data[:10, :10], 1)
 
-    layer.brush_size = 9
+    layer.brush_size = brush_size
     layer.paint([0, 0], 2)
-    assert np.unique(layer.data[:5, :5]) == 2
-    assert np.unique(layer.data[5:10, 5:10]) == 1
-
-    layer.brush_size = 10
-    layer.paint([0, 0], 2)
-    assert np.unique(layer.data[:6, :6]) == 2
-    assert np.unique(layer.data[6:10, 6:10]) == 1
-
-    layer.brush_size = 19
-    layer.paint([0, 0], 2)
-    assert np.unique(layer.data[:5, :5]) == 2
-    assert np.unique(layer.data[5:10, 5:10]) == 2
+    assert np.array_equiv(layer.data[painted], 2)
+    if untouched is not None:
+        assert np.array_equiv(layer.data[untouched], 1)
 
 
 def test_paint_with_preserve_labels():
     """Test painting labels while preserving existing labels"""
-    data = np.zeros((15, 10))
+    data = np.zeros((15, 10), dtype=np.uint8)
     data[:3, :3] = 1
     layer = Labels(data)
     layer.preserve_labels = True
-    assert np.unique(layer.data[:3, :3]) == 1
+    assert np.array_equiv(layer.data[:3, :3], 1)
 
     layer.brush_size = 9
     layer.paint([0, 0], 2)
 
-    assert np.unique(layer.data[3:5, 0:5]) == 2
-    assert np.unique(layer.data[0:5, 3:5]) == 2
-    assert np.unique(layer.data[:3, :3]) == 1
+    assert np.array_equiv(layer.data[3:5, 0:5], 2)
+    assert np.array_equiv(layer.data[0:5, 3:5], 2)
+    assert np.array_equiv(layer.data[:3, :3], 1)
 
 
 def test_fill():
     """Test filling labels with different brush sizes."""
-    np.random.seed(0)
-    data = np.random.randint(20, size=(10, 15))
+    rng = np.random.RandomState(0)
+    data = rng.randint(20, size=(10, 15))
     data[:10, :10] = 2
     data[:5, :5] = 1
     layer = Labels(data)
-    assert np.unique(layer.data[:5, :5]) == 1
-    assert np.unique(layer.data[5:10, 5:10]) == 2
+    assert np.array_equiv(layer.data[:5, :5], 1)
+    assert np.array_equiv(layer.data[5:10, 5:10], 2)
 
     layer.fill([0, 0], 3)
-    assert np.unique(layer.data[:5, :5]) == 3
-    assert np.unique(layer.data[5:10, 5:10]) == 2
+    assert np.array_equiv(layer.data[:5, :5], 3)
+    assert np.array_equiv(layer.data[5:10, 5:10], 2)
 
 
-def test_value():
+def test_value(small_random_labels, small_random_labels_layer):
     """Test getting the value of the data at the current coordinates."""
-    np.random.seed(0)
-    data = np.random.randint(20, size=(10, 15))
-    layer = Labels(data)
+    layer = small_random_labels_layer
     value = layer.get_value()
     assert layer.coordinates == (0, 0)
-    assert value == data[0, 0]
+    assert value == small_random_labels[0, 0]
 
 
-def test_message():
+def test_message(small_random_labels_layer):
     """Test converting value and coords to message."""
-    np.random.seed(0)
-    data = np.random.randint(20, size=(10, 15))
-    layer = Labels(data)
+    layer = small_random_labels_layer
     msg = layer.get_message()
     assert type(msg) == str
 
 
 def test_thumbnail():
     """Test the image thumbnail for square data."""
-    np.random.seed(0)
-    data = np.random.randint(20, size=(30, 30))
+    data = np.zeros((30, 30), dtype=np.uint8)
     layer = Labels(data)
     layer._update_thumbnail()
     assert layer.thumbnail.shape == layer._thumbnail_shape
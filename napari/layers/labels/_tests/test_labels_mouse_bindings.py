@@ -25,7 +25,7 @@ def Event():
 
 def test_paint(Event):
     """Test painting labels with different brush sizes."""
-    data = np.ones((20, 20))
+    data = np.ones((20, 20), dtype=np.uint8)
     layer = Labels(data)
     layer.brush_size = 10
     layer.mode = 'paint'
@@ -48,15 +48,15 @@ def test_paint(Event):
 
     # Painting goes from (0, 0) to (19, 19) with a brush size of 10, changing
     # all pixels along that path, but non outside it.
-    assert np.unique(layer.data[:5, :5]) == 3
-    assert np.unique(layer.data[-5:, -5:]) == 3
-    assert np.unique(layer.data[:5, -5:]) == 1
-    assert np.unique(layer.data[-5:, :5]) == 1
+    assert np.array_equiv(layer.data[:5, :5], 3)
+    assert np.array_equiv(layer.data[-5:, -5:], 3)
+    assert np.array_equiv(layer.data[:5, -5:], 1)
+    assert np.array_equiv(layer.data[-5:, :5], 1)
 
 
 def test_erase(Event):
     """Test erasing labels with different brush sizes."""
-    data = np.ones((20, 20))
+    data = np.ones((20, 20), dtype=np.uint8)
     layer = Labels(data)
     layer.brush_size = 10
     layer.mode = 'erase'
@@ -79,15 +79,15 @@ def test_erase(Event):
 
     # Painting goes from (0, 0) to (19, 19) with a brush size of 10, changing
     # all pixels along that path, but non outside it.
-    assert np.unique(layer.data[:5, :5]) == 0
-    assert np.unique(layer.data[-5:, -5:]) == 0
-    assert np.unique(layer.data[:5, -5:]) == 1
-    assert np.unique(layer.data[-5:, :5]) == 1
+    assert np.array_equiv(layer.data[:5, :5], 0)
+    assert np.array_equiv(layer.data[-5:, -5:], 0)
+    assert np.array_equiv(layer.data[:5, -5:], 1)
+    assert np.array_equiv(layer.data[-5:, :5], 1)
 
 
 def test_pick(Event):
     """Test picking label."""
-    data = np.ones((20, 20))
+    data = np.ones((20, 20), dtype=np.uint8)
     data[:5, :5] = 2
     data[-5:, -5:] = 3
     layer = Labels(data)
@@ -111,14 +111,14 @@ def test_pick(Event):
 
 def test_fill(Event):
     """Test filling label."""
-    data = np.ones((20, 20))
+    data = np.ones((20, 20), dtype=np.uint8)
     data[:5, :5] = 2
     data[-5:, -5:] = 3
     layer = Labels(data)
-    assert np.unique(layer.data[:5, :5]) == 2
-    assert np.unique(layer.data[-5:, -5:]) == 3
-    assert np.unique(layer.data[:5, -5:]) == 1
-    assert np.unique(layer.data[-5:, :5]) == 1
+    assert np.array_equiv(layer.data[:5, :5], 2)
+    assert np.array_equiv(layer.data[-5:, -5:], 3)
+    assert np.array_equiv(layer.data[:5, -5:], 1)
+    assert np.array_equiv(layer.data[-5:, :5], 1)
 
     layer.mode = 'fill'
     layer.position = (0, 0)
@@ -127,10 +127,10 @@ def test_fill(Event):
     # Simulate click
     event = ReadOnlyWrapper(Event(type='mouse_press', is_dragging=False))
     mouse_press_callbacks(layer, event)
-    assert np.unique(layer.data[:5, :5]) == 4
-    assert np.unique(layer.data[-5:, -5:]) == 3
-    assert np.unique(layer.data[:5, -5:]) == 1
-    assert np.unique(layer.data[-5:, :5]) == 1
+    assert np.array_equiv(layer.data[:5, :5], 4)
+    assert np.array_equiv(layer.data[-5:, -5:], 3)
+    assert np.array_equiv(layer.data[:5, -5:], 1)
+    assert np.array_equiv(layer.data[-5:, :5], 1)
 
     layer.position = (19, 19)
     layer.selected_label = 5
@@ -138,24 +138,24 @@ def test_fill(Event):
     # Simulate click
     event = ReadOnlyWrapper(Event(type='mouse_press', is_dragging=False))
     mouse_press_callbacks(layer, event)
-    assert np.unique(layer.data[:5, :5]) == 4
-    assert np.unique(layer.data[-5:, -5:]) == 5
-    assert np.unique(layer.data[:5, -5:]) == 1
-    assert np.unique(layer.data[-5:, :5]) == 1
+    assert np.array_equiv(layer.data[:5, :5], 4)
+    assert np.array_equiv(layer.data[-5:, -5:], 5)
+    assert np.array_equiv(layer.data[:5, -5:], 1)
+    assert np.array_equiv(layer.data[-5:, :5], 1)
 
 
 def test_fill_nD_plane(Event):
     """Test filling label nD plane."""
-    data = np.ones((20, 20, 20))
+    data = np.ones((20, 20, 20), dtype=np.uint8)
     data[:5, :5, :5] = 2
     data[0, 8:10, 8:10] = 2
     data[-5:, -5:, -5:] = 3
     layer = Labels(data)
-    assert np.unique(layer.data[:5, :5, :5]) == 2
-    assert np.unique(layer.data[-5:, -5:, -5:]) == 3
-    assert np.unique(layer.data[:5, -5:, -5:]) == 1
-    assert np.unique(layer.data[-5:, :5, -5:]) == 1
-    assert np.unique(layer.data[0, 8:10, 8:10]) == 2
+    assert np.array_equiv(layer.data[:5, :5, :5], 2)
+    assert np.array_equiv(layer.data[-5:, -5:, -5:], 3)
+    assert np.array_equiv(layer.data[:5, -5:, -5:], 1)
+    assert np.array_equiv(layer.data[-5:, :5, -5:], 1)
+    assert np.array_equiv(layer.data[0, 8:10, 8:10], 2)
 
     layer.mode = 'fill'
     layer.position = (0, 0)
@@ -164,12 +164,12 @@ def test_fill_nD_plane(Event):
     # Simulate click
     event = ReadOnlyWrapper(Event(type='mouse_press', is_dragging=False))
     mouse_press_callbacks(layer, event)
-    assert np.unique(layer.data[0, :5, :5]) == 4
-    assert np.unique(layer.data[1:5, :5, :5]) == 2
-    assert np.unique(layer.data[-5:, -5:, -5:]) == 3
-    assert np.unique(layer.data[:5, -5:, -5:]) == 1
-    assert np.unique(layer.data[-5:, :5, -5:]) == 1
-    assert np.unique(layer.data[0, 8:10, 8:10]) == 2
+    assert np.array_equiv(layer.data[0, :5, :5], 4)
+    assert np.array_equiv(layer.data[1:5, :5, :5], 2)
+    assert np.array_equiv(layer.data[-5:, -5:, -5:], 3)
+    assert np.array_equiv(layer.data[:5, -5:, -5:], 1)
+    assert np.array_equiv(layer.data[-5:, :5, -5:], 1)
+    assert np.array_equiv(layer.data[0, 8:10, 8:10], 2)
 
     layer.position = (19, 19)
     layer.selected_label = 5
@@ -177,28 +177,28 @@ def test_fill_nD_plane(Event):
     # Simulate click
     event = ReadOnlyWrapper(Event(type='mouse_press', is_dragging=False))
     mouse_press_callbacks(layer, event)
-    assert np.unique(layer.data[0, :5, :5]) == 4
-    assert np.unique(layer.data[1:5, :5, :5]) == 2
-    assert np.unique(layer.data[-5:, -5:, -5:]) == 3
-    assert np.unique(layer.data[1:5, -5:, -5:]) == 1
-    assert np.unique(layer.data[-5:, :5, -5:]) == 1
-    assert np.unique(layer.data[0, -5:, -5:]) == 5
-    assert np.unique(layer.data[0, :5, -5:]) == 5
-    assert np.unique(layer.data[0, 8:10, 8:10]) == 2
+    assert np.array_equiv(layer.data[0, :5, :5], 4)
+    assert np.array_equiv(layer.data[1:5, :5, :5], 2)
+    assert np.array_equiv(layer.data[-5:, -5:, -5:], 3)
+    assert np.array_equiv(layer.data[1:5, -5:, -5:], 1)
+    assert np.array_equiv(layer.data[-5:, :5, -5:], 1)
+    assert np.array_equiv(layer.data[0, -5:, -5:], 5)
+    assert np.array_equiv(layer.data[0, :5, -5:], 5)
+    assert np.array_equiv(layer.data[0, 8:10, 8:10], 2)
 
 
 def test_fill_nD_all(Event):
     """Test filling label nD."""
-    data = np.ones((20, 20, 20))
+    data = np.ones((20, 20, 20), dtype=np.uint8)
     data[:5, :5, :5] = 2
     data[0, 8:10, 8:10] = 2
     data[-5:, -5:, -5:] = 3
     layer = Labels(data)
-    assert np.unique(layer.data[:5, :5, :5]) == 2
-    assert np.unique(layer.data[-5:, -5:, -5:]) == 3
-    assert np.unique(layer.data[:5, -5:, -5:]) == 1
-    assert np.unique(layer.data[-5:, :5, -5:]) == 1
-    assert np.unique(layer.data[0, 8:10, 8:10]) == 2
+    assert np.array_equiv(layer.data[:5, :5, :5], 2)
+    assert np.array_equiv(layer.data[-5:, -5:, -5:], 3)
+    assert np.array_equiv(layer.data[:5, -5:, -5:], 1)
+    assert np.array_equiv(layer.data[-5:, :5, -5:], 1)
+    assert np.array_equiv(layer.data[0, 8:10, 8:10], 2)
 
     layer.n_dimensional = True
     layer.mode = 'fill'
@@ -208,11 +208,11 @@ def test_fill_nD_all(Event):
     # Simulate click
     event = ReadOnlyWrapper(Event(type='mouse_press', is_dragging=False))
     mouse_press_callbacks(layer, event)
-    assert np.unique(layer.data[:5, :5, :5]) == 4
-    assert np.unique(layer.data[-5:, -5:, -5:]) == 3
-    assert np.unique(layer.data[:5, -5:, -5:]) == 1
-    assert np.unique(layer.data[-5:, :5, -5:]) == 1
-    assert np.unique(layer.data[0, 8:10, 8:10]) == 2
+    assert np.array_equiv(layer.data[:5, :5, :5], 4)
+    assert np.array_equiv(layer.data[-5:, -5:, -5:], 3)
+    assert np.array_equiv(layer.data[:5, -5:, -5:], 1)
+    assert np.array_equiv(layer.data[-5:, :5, -5:], 1)
+    assert np.array_equiv(layer.data[0, 8:10, 8:10], 2)
 
     layer.position = (19, 19)
     layer.selected_label = 5
@@ -220,8 +220,8 @@ def test_fill_nD_all(Event):
     # Simulate click
     event = ReadOnlyWrapper(Event(type='mouse_press', is_dragging=False))
     mouse_press_callbacks(layer, event)
-    assert np.unique(layer.data[:5, :5, :5]) == 4
-    assert np.unique(layer.data[-5:, -5:, -5:]) == 3
-    assert np.unique(layer.data[:5, -5:, -5:]) == 5
-    assert np.unique(layer.data[-5:, :5, -5:]) == 5
-    assert np.unique(layer.data[0, 8:10, 8:10]) == 2
+    assert np.array_equiv(layer.data[:5, :5, :5], 4)
+    assert np.array_equiv(layer.data[-5:, -5:, -5:], 3)
+    assert np.array_equiv(layer.data[:5, -5:, -5:], 5)
+    assert np.array_equiv(layer.data[-5:, :5, -5:], 5)
+    assert np.array_equiv(layer.data[0, 8:10, 8:10], 2)
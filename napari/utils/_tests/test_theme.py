@@ -0,0 +1,70 @@
+import pytest
+
+from napari.utils import theme
+from napari.utils.theme import (
+    _parse_color_as_rgb,
+    _template,
+    palettes,
+    template,
+)
+
+
+def test_template_cached():
+    """Test that rendering the same css and palette again hits the cache."""
+    css = 'QWidget { background: {{ background }}; }'
+    _template.cache_clear()
+    first = template(css, **palettes['dark'])
+    assert first == 'QWidget { background: rgb(38, 41, 48); }'
+    assert template(css, **palettes['dark']) is first
+    assert _template.cache_info().hits == 1
+
+    light = template(css, **palettes['light'])
+    assert light == 'QWidget { background: rgb(239, 235, 233); }'
+    assert _template.cache_info().misses == 2
+
+
+def test_template_color_functions():
+    """Test darken and lighten, with and without a percentage."""
+    palette = {'primary': 'rgb(100, 100, 100)'}
+    css = (
+        '{{ darken(primary, 50) }} {{ lighten(primary, 50) }} '
+        '{{ darken(primary) }} {{ primary }}'
+    )
+    assert template(css, **palette) == (
+        'rgb(50, 50, 50) rgb(177, 177, 177) rgb(90, 90, 90) '
+        'rgb(100, 100, 100)'
+    )
+
+
+def test_parse_color_as_rgb():
+    """Test parsing rgb strings, including ones without spaces."""
+    assert _parse_color_as_rgb('rgb(38, 41, 48)') == (38, 41, 48)
+    assert _parse_color_as_rgb('rgb(0,122,204)') == (0, 122, 204)
+    assert _parse_color_as_rgb('black') == 'black'
+
+
+@pytest.fixture
+def gradients_enabled(monkeypatch):
+    """Force gradients on, keeping forced output out of the shared cache."""
+    monkeypatch.setattr(theme, 'use_gradients', True)
+    _template.cache_clear()
+    yield
+    _template.cache_clear()
+
+
+@pytest.mark.parametrize(
+    'direction, end', [('h', 'x2: 1, y2: 0'), ('v', 'x2: 0, y2: 1')]
+)
+def test_template_gradient(gradients_enabled, direction, end):
+    """Test that the gradient direction follows the h/v prefix."""
+    css = direction + 'gradient({{ lighten(primary, 50) }} - {{ primary }})'
+    assert template(css, primary='rgb(100, 100, 100)') == (
+        f'qlineargradient(x1: 0, y1: 0, {end}, '
+        'stop: 0 rgb(177, 177, 177), stop: 1 rgb(100, 100, 100))'
+    )
+
+
+def test_template_unknown_variable():
+    """Test that variables missing from the palette are left in place."""
+    css = '{{ text }} {{ missing }} {{ text}}'
+    assert template(css, text='red') == 'red {{ missing }} {{ text}}'
@@ -1,7 +1,7 @@
 # syntax_style for the console must be one of the supported styles from
 # pygments - see here for examples https://help.farbox.com/pygments.html
 import re
-from ast import literal_eval
+from functools import lru_cache
 
 try:
     from qtpy import QT_VERSION
@@ -45,14 +45,26 @@ palettes = {
     },
 }
 
-gradient_pattern = re.compile(r'([vh])gradient\((.+)\)')
-darken_pattern = re.compile(r'{{\s?darken\((\w+),?\s?([-\d]+)?\)\s?}}')
-lighten_pattern = re.compile(r'{{\s?lighten\((\w+),?\s?([-\d]+)?\)\s?}}')
+gradient_pattern = re.compile(r'(?P<direction>[vh])gradient\((?P<stops>.+)\)')
+variable_pattern = re.compile(r'{{ (\w+) }}')
+color_pattern = re.compile(
+    r'{{\s?(darken|lighten)\((\w+),?\s?([-\d]+)?\)\s?}}'
+)
 
 
-def darken(color: str, percentage=10):
+@lru_cache(maxsize=64)
+def _parse_color_as_rgb(color: str):
+    # palettes hold a few colors that are darkened/lightened many times
+    # per stylesheet, so only parse each rgb string once
     if color.startswith('rgb('):
-        color = literal_eval(color.lstrip('rgb(').rstrip(')'))
+        red, green, blue = color[4 : color.index(')')].split(',')
+        return int(red), int(green), int(blue)
+    return color
+
+
+@lru_cache(maxsize=256)
+def darken(color: str, percentage=10):
+    color = _parse_color_as_rgb(color)
     ratio = 1 - float(percentage) / 100
     red, green, blue = color
     red = min(max(int(red * ratio), 0), 255)
@@ -61,9 +73,9 @@ def darken(color: str, percentage=10):
     return f'rgb({red}, {green}, {blue})'
 
 
+@lru_cache(maxsize=256)
 def lighten(color: str, percentage=10):
-    if color.startswith('rgb('):
-        color = literal_eval(color.lstrip('rgb(').rstrip(')'))
+    color = _parse_color_as_rgb(color)
     ratio = float(percentage) / 100
     red, green, blue = color
     red = min(max(int(red + (255 - red) * ratio), 0), 255)
@@ -88,22 +100,35 @@ def gradient(stops, horizontal=True):
 
 
 def template(css, **palette):
-    def darken_match(matchobj):
-        color, percentage = matchobj.groups()
-        return darken(palette[color], percentage)
+    # stylesheets are re-templated on every palette change with the same
+    # handful of (css, palette) pairs, so cache the rendered output
+    return _template(css, tuple(sorted(palette.items())))
+
+
+# note that the cached output also depends on the module level
+# use_gradients flag, which is not part of the cache key
+@lru_cache(maxsize=16)
+def _template(css, palette_items):
+    palette = dict(palette_items)
+
+    def color_match(matchobj):
+        func, color, percentage = matchobj.groups()
+        func = darken if func == 'darken' else lighten
+        if percentage is None:
+            return func(palette[color])
+        return func(palette[color], percentage)
 
-    def lighten_match(matchobj):
-        color, percentage = matchobj.groups()
-        return lighten(palette[color], percentage)
+    def variable_match(matchobj):
+        return palette.get(matchobj.group(1), matchobj.group(0))
 
     def gradient_match(matchobj):
-        horizontal = matchobj.groups()[1] == 'h'
-        stops = [i.strip() for i in matchobj.groups()[1].split('-')]
+        horizontal = matchobj.group('direction') == 'h'
+        stops = [i.strip() for i in matchobj.group('stops').split('-')]
         return gradient(stops, horizontal)
 
-    for k, v in palette.items():
+    # the function substitutions don't depend on the palette keys, so do
+    # each of them in a single pass over the stylesheet
+    if 'gradient(' in css:
         css = gradient_pattern.sub(gradient_match, css)
-        css = darken_pattern.sub(darken_match, css)
-        css = lighten_pattern.sub(lighten_match, css)
-        css = css.replace('{{ %s }}' % k, v)
-    return css
+    css = color_pattern.sub(color_match, css)
+    return variable_pattern.sub(variable_match, css)